@@ -3,11 +3,38 @@ Integration module for NVIDIA LangChain Report Generator
 Connects AIQToolkit to the NVIDIA Brev environment
 """
 
-import requests
-import json
+import httpx
+import ujson as json  # Faster JSON
 from typing import Dict, Any, Optional
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential, wait_random
 from aiq.builder.function_base import AIQFunctionBase
 
+_MAX_RETRY_WAIT = 30.0
+# Exponential backoff plus up to 1s of jitter, capped at _MAX_RETRY_WAIT. Not
+# wait_exponential_jitter: its `initial` is deprecated in tenacity 9.2.1 and the
+# `multiplier` replacement is missing from earlier 9.x releases
+_backoff = wait_exponential(multiplier=0.5, max=_MAX_RETRY_WAIT - 1.0) + wait_random(0, 1.0)
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Rate limits, server errors and failed connects are worth retrying"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    # Only retry when the request never reached the server; /generate is not idempotent
+    return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+def _wait_retry_after(retry_state) -> float:
+    """Honor a numeric Retry-After header (capped), otherwise back off exponentially"""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), _MAX_RETRY_WAIT)
+    return _backoff(retry_state)
+
+
 class NVIDIAReportGenerator(AIQFunctionBase):
     """
     Connects to NVIDIA LangChain report generator running on Brev
@@ -18,6 +45,28 @@ class NVIDIAReportGenerator(AIQFunctionBase):
         self.description = description
         self.api_key = None  # Add if needed
         
+        # Shared keep-alive pool so consecutive calls reuse connections
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16)
+        )
+        
+    @retry(
+        retry=retry_if_exception(_is_transient_error),
+        wait=_wait_retry_after,
+        stop=stop_after_attempt(6),
+        reraise=True
+    )
+    async def _post(self, headers: Dict[str, str], body: str) -> httpx.Response:
+        """POST to the generate endpoint, retrying on rate limits and 5xx"""
+        response = await self._client.post(
+            f"{self.endpoint}/generate",
+            headers=headers,
+            content=body
+        )
+        response.raise_for_status()
+        return response
+        
     async def run(self, prompt: str, **kwargs) -> Dict[str, Any]:
         """
         Generate a structured report using NVIDIA LangChain
@@ -37,19 +86,14 @@ class NVIDIAReportGenerator(AIQFunctionBase):
             }
             
             # Call the NVIDIA endpoint
-            response = requests.post(
-                f"{self.endpoint}/generate",
-                headers=headers,
-                json=payload
-            )
+            response = await self._post(headers, json.dumps(payload))
+            return json.loads(response.content)
             
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {
-                    "error": f"API Error: {response.status_code}",
-                    "message": response.text
-                }
+        except httpx.HTTPStatusError as e:
+            return {
+                "error": f"API Error: {e.response.status_code}",
+                "message": e.response.text
+            }
                 
         except Exception as e:
             return {
@@ -57,6 +101,10 @@ class NVIDIAReportGenerator(AIQFunctionBase):
                 "message": "Failed to connect to NVIDIA report generator"
             }
     
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        await self._client.aclose()
+    
     def get_description(self) -> str:
         return self.description
         
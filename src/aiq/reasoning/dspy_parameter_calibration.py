@@ -7,17 +7,14 @@ adaptive optimization for DSPy reasoning systems in AIQToolkit.
 """
 
 import numpy as np
-import torch
-import torch.nn as nn
-from typing import Dict, Any, Tuple, Optional, Union
+from typing import Any, ClassVar, Dict, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
+from functools import lru_cache
 import logging
 from pathlib import Path
 import json
-import matplotlib.pyplot as plt
-from scipy.optimize import minimize_scalar
-from sklearn.isotonic import IsotonicRegression
-from sklearn.linear_model import LogisticRegression
+from scipy.optimize import isotonic_regression, minimize_scalar
+from scipy.special import expit, log_softmax, logsumexp, softmax
 
 logger = logging.getLogger(__name__)
 
@@ -59,46 +56,64 @@ class DSPyParameterBounds:
     tolerance_max: float = 1e-2
     tolerance_default: float = 1e-4
     
+    # Parameters with *_min/*_max boundaries defined above
+    PARAMETER_NAMES: ClassVar[Tuple[str, ...]] = (
+        "temperature", "max_tokens", "learning_rate", "max_rounds",
+        "max_examples", "reasoning_weight", "tolerance"
+    )
+    
+    # name -> (min attribute, max attribute); bounds are read at lookup time
+    # so mutating an instance's boundaries takes effect immediately
+    _BOUND_ATTRS: ClassVar[Dict[str, Tuple[str, str]]] = {
+        name: (f"{name}_min", f"{name}_max") for name in PARAMETER_NAMES
+    }
+    
     def validate_parameter(self, param_name: str, value: Union[float, int]) -> bool:
         """Validate parameter against defined boundaries."""
         
-        if param_name == "temperature":
-            return self.temperature_min <= value <= self.temperature_max
-        elif param_name == "max_tokens":
-            return self.max_tokens_min <= value <= self.max_tokens_max
-        elif param_name == "learning_rate":
-            return self.learning_rate_min <= value <= self.learning_rate_max
-        elif param_name == "max_rounds":
-            return self.max_rounds_min <= value <= self.max_rounds_max
-        elif param_name == "max_examples":
-            return self.max_examples_min <= value <= self.max_examples_max
-        elif param_name == "reasoning_weight":
-            return self.reasoning_weight_min <= value <= self.reasoning_weight_max
-        elif param_name == "tolerance":
-            return self.tolerance_min <= value <= self.tolerance_max
-        else:
+        attrs = self._BOUND_ATTRS.get(param_name)
+        if attrs is None:
             logger.warning(f"Unknown parameter: {param_name}")
             return False
+        
+        return getattr(self, attrs[0]) <= value <= getattr(self, attrs[1])
     
     def clip_parameter(self, param_name: str, value: Union[float, int]) -> Union[float, int]:
         """Clip parameter to valid boundaries."""
         
-        if param_name == "temperature":
-            return np.clip(value, self.temperature_min, self.temperature_max)
-        elif param_name == "max_tokens":
-            return np.clip(value, self.max_tokens_min, self.max_tokens_max)
-        elif param_name == "learning_rate":
-            return np.clip(value, self.learning_rate_min, self.learning_rate_max)
-        elif param_name == "max_rounds":
-            return np.clip(value, self.max_rounds_min, self.max_rounds_max)
-        elif param_name == "max_examples":
-            return np.clip(value, self.max_examples_min, self.max_examples_max)
-        elif param_name == "reasoning_weight":
-            return np.clip(value, self.reasoning_weight_min, self.reasoning_weight_max)
-        elif param_name == "tolerance":
-            return np.clip(value, self.tolerance_min, self.tolerance_max)
-        else:
+        attrs = self._BOUND_ATTRS.get(param_name)
+        if attrs is None:
             return value
+        
+        return min(max(value, getattr(self, attrs[0])), getattr(self, attrs[1]))
+    
+    def validate_all(self, config: Any) -> Dict[str, bool]:
+        """Validate every bounded parameter of a config object in one pass."""
+        
+        return _validate_bounds(config, self)
+
+
+def _compile_bounds_validator(param_names: Tuple[str, ...]):
+    """
+    Generate a validator with one inlined range check per parameter.
+    
+    The parameter list is fixed, so emitting straight-line code avoids the
+    getattr and dict iteration of a generic loop.
+    """
+    checks = ",\n".join(
+        f"        {name!r}: bounds.{name}_min <= config.{name} <= bounds.{name}_max"
+        for name in param_names
+    )
+    source = f"def _validate_bounds(config, bounds):\n    return {{\n{checks}\n    }}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<dspy_bounds_validator>", "exec"), namespace)
+    return namespace["_validate_bounds"]
+
+
+_validate_bounds = _compile_bounds_validator(DSPyParameterBounds.PARAMETER_NAMES)
+
+# Shared default boundaries, so configs and validators don't rebuild them per call
+_DEFAULT_BOUNDS = DSPyParameterBounds()
 
 
 @dataclass
@@ -128,11 +143,10 @@ class DSPyCalibrationConfig:
         if not self.validate_parameters:
             return
             
-        bounds = DSPyParameterBounds()
+        bounds = _DEFAULT_BOUNDS
         
         # Validate all parameters
-        for param_name in ["temperature", "max_tokens", "learning_rate", 
-                          "max_rounds", "max_examples", "reasoning_weight", "tolerance"]:
+        for param_name in bounds.PARAMETER_NAMES:
             value = getattr(self, param_name)
             
             if not bounds.validate_parameter(param_name, value):
@@ -144,48 +158,191 @@ class DSPyCalibrationConfig:
                     raise ValueError(f"Invalid {param_name}: {value}")
 
 
-class TemperatureScaling(nn.Module):
-    """
-    Temperature scaling for confidence calibration.
+@lru_cache(maxsize=None)
+def _temperature_scaling_class() -> type:
+    """Build TemperatureScaling on first use so importing this module doesn't load torch."""
+    import torch
+    import torch.nn as nn
     
-    Reference: Guo, C., et al. (2017). "On Calibration of Modern Neural Networks."
-    """
-    
-    def __init__(self, initial_temperature: float = 1.0):
-        super().__init__()
-        self.temperature = nn.Parameter(torch.ones(1) * initial_temperature)
-        
-    def forward(self, logits: torch.Tensor) -> torch.Tensor:
-        """Apply temperature scaling to logits."""
-        return logits / self.temperature
-    
-    def calibrate(self, logits: torch.Tensor, labels: torch.Tensor, 
-                  max_iter: int = 50, lr: float = 0.01) -> float:
+    class TemperatureScaling(nn.Module):
         """
-        Calibrate temperature using validation data.
+        Temperature scaling for confidence calibration.
         
-        Args:
-            logits: Model output logits [N, C]
-            labels: True labels [N]
-            max_iter: Maximum optimization iterations
-            lr: Learning rate for temperature optimization
-            
-        Returns:
-            Calibrated temperature value
+        Reference: Guo, C., et al. (2017). "On Calibration of Modern Neural Networks."
         """
-        self.train()
-        optimizer = torch.optim.LBFGS([self.temperature], lr=lr, max_iter=max_iter)
-        
-        def eval_loss():
-            optimizer.zero_grad()
-            loss = nn.CrossEntropyLoss()(self.forward(logits), labels)
-            loss.backward()
-            return loss
         
-        optimizer.step(eval_loss)
+        def __init__(self, initial_temperature: float = 1.0):
+            super().__init__()
+            self.temperature = nn.Parameter(torch.ones(1) * initial_temperature)
+            
+        def forward(self, logits: torch.Tensor) -> torch.Tensor:
+            """Apply temperature scaling to logits."""
+            return logits / self.temperature
+        
+        def calibrate(self, logits: torch.Tensor, labels: torch.Tensor, 
+                      max_iter: int = 50, lr: float = 0.01) -> float:
+            """
+            Calibrate temperature using validation data.
+            
+            Args:
+                logits: Model output logits [N, C]
+                labels: True labels [N]
+                max_iter: Maximum optimization iterations
+                lr: Unused; kept for backward compatibility with the LBFGS optimizer
+                
+            Returns:
+                Calibrated temperature value
+            """
+            logits_np = torch.as_tensor(logits).detach().cpu().double().numpy()
+            labels_np = torch.as_tensor(labels).detach().cpu().long().numpy()
+            
+            # NLL(T) = mean(logsumexp(z / T)) - mean(z_true) / T, so the true-class
+            # term is a constant and each probe costs a single reduction
+            true_logit_mean = logits_np[np.arange(len(labels_np)), labels_np].mean()
+            
+            def nll(temperature):
+                return logsumexp(logits_np / temperature, axis=1).mean() - true_logit_mean / temperature
+            
+            result = minimize_scalar(
+                nll,
+                bounds=(0.05, 10.0),
+                method='bounded',
+                options={"maxiter": max_iter}
+            )
+            
+            with torch.no_grad():
+                self.temperature.fill_(float(result.x))
+            
+            return self.temperature.item()
+    
+    # Resolvable (and picklable) as a module attribute via __getattr__ below
+    TemperatureScaling.__module__ = __name__
+    TemperatureScaling.__qualname__ = "TemperatureScaling"
+    return TemperatureScaling
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily built classes on attribute access."""
+    if name == "TemperatureScaling":
+        return _temperature_scaling_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _bin_stats(predictions: np.ndarray, targets: np.ndarray,
+               n_bins: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-bin statistics over equal-width (lower, upper] probability bins.
+    
+    Args:
+        predictions: Predicted probabilities [N]
+        targets: True binary targets [N]
+        n_bins: Number of bins
+        
+    Returns:
+        Mean accuracies, mean confidences and counts [n_bins];
+        empty bins have zero accuracy and confidence
+    """
+    # Estimate each bin with ceil(p * n_bins), then correct the off-by-one that
+    # rounding causes for predictions on an edge; p == 0 goes to the first bin
+    bin_edges = np.linspace(0, 1, n_bins + 1)
+    bin_ids = np.clip(np.ceil(predictions * n_bins).astype(np.intp) - 1, 0, n_bins - 1)
+    bin_ids -= (predictions <= bin_edges[bin_ids]) & (bin_ids > 0)
+    bin_ids += (predictions > bin_edges[bin_ids + 1]) & (bin_ids < n_bins - 1)
+    counts = np.bincount(bin_ids, minlength=n_bins)
+    confidence_sums = np.bincount(bin_ids, weights=predictions, minlength=n_bins)
+    accuracy_sums = np.bincount(bin_ids, weights=targets, minlength=n_bins)
+    
+    safe_counts = np.maximum(counts, 1)
+    return accuracy_sums / safe_counts, confidence_sums / safe_counts, counts
+
+
+def _fit_platt(scores: np.ndarray, targets: np.ndarray,
+               max_iter: int = 100, tol: float = 1e-5) -> Tuple[float, float]:
+    """
+    Fit Platt's sigmoid P(y=1|f) = 1 / (1 + exp(A*f + B)) by Newton's method.
+    
+    Reference: Lin, H.-T., Lin, C.-J., and Weng, R. C. (2007). "A note on
+    Platt's probabilistic outputs for support vector machines."
+    
+    Args:
+        scores: Uncalibrated scores [N]
+        targets: Binary targets (0/1) [N]
+        max_iter: Maximum Newton iterations
+        tol: Gradient tolerance for convergence
+        
+    Returns:
+        Fitted (A, B) parameters
+    """
+    n_positive = float(np.sum(targets))
+    n_negative = len(targets) - n_positive
+    
+    # Platt's label smoothing guards against overfitting the extremes
+    t = np.where(targets > 0,
+                 (n_positive + 1.0) / (n_positive + 2.0),
+                 1.0 / (n_negative + 2.0))
+    
+    def negative_log_likelihood(a, b):
+        f_ab = scores * a + b
+        return np.sum(t * f_ab + np.logaddexp(0.0, -f_ab))
+    
+    a, b = 0.0, np.log((n_negative + 1.0) / (n_positive + 1.0))
+    fval = negative_log_likelihood(a, b)
+    sigma = 1e-12  # Keeps the Hessian positive definite
+    
+    for _ in range(max_iter):
+        p = expit(-(scores * a + b))
+        d1 = t - p
+        d2 = p * (1.0 - p)
+        
+        g1 = np.dot(scores, d1)
+        g2 = d1.sum()
+        if abs(g1) < tol and abs(g2) < tol:
+            break
+        
+        h11 = sigma + np.dot(scores * scores, d2)
+        h22 = sigma + d2.sum()
+        h21 = np.dot(scores, d2)
+        det = h11 * h22 - h21 * h21
+        da = -(h22 * g1 - h21 * g2) / det
+        db = -(-h21 * g1 + h11 * g2) / det
+        gd = g1 * da + g2 * db
+        
+        # Backtracking line search
+        step = 1.0
+        while step >= 1e-10:
+            new_a, new_b = a + step * da, b + step * db
+            new_f = negative_log_likelihood(new_a, new_b)
+            if new_f < fval + 1e-4 * step * gd:
+                a, b, fval = new_a, new_b, new_f
+                break
+            step /= 2.0
+        else:
+            logger.warning("Platt scaling line search failed to converge")
+            break
+    
+    return float(a), float(b)
+
+
+def _fit_isotonic(scores: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fit a non-decreasing step function with the pool-adjacent-violators algorithm.
+    
+    Args:
+        scores: Uncalibrated scores [N]
+        targets: Binary targets (0/1) [N]
         
-        self.eval()
-        return self.temperature.item()
+    Returns:
+        Breakpoints (sorted unique scores) and fitted values at each breakpoint
+    """
+    # Collapse tied scores into weighted points, already in sorted order
+    breakpoints, inverse = np.unique(scores, return_inverse=True)
+    weights = np.bincount(inverse).astype(np.float64)
+    sums = np.bincount(inverse, weights=targets)
+    
+    # Compiled weighted PAV over the per-score mean targets
+    fitted = isotonic_regression(sums / weights, weights=weights)
+    
+    return breakpoints, fitted.x
 
 
 class DSPyConfidenceCalibrator:
@@ -198,6 +355,11 @@ class DSPyConfidenceCalibrator:
     def __init__(self, method: str = "platt"):
         self.method = method
         self.calibrator = None
+        self.A: Optional[float] = None
+        self.B: Optional[float] = None
+        self.breakpoints: Optional[np.ndarray] = None
+        self.values: Optional[np.ndarray] = None
+        self.temperature: Optional[float] = None  # Set when loaded without torch
         self.is_fitted = False
         
     def fit(self, predictions: np.ndarray, targets: np.ndarray) -> 'DSPyConfidenceCalibrator':
@@ -211,22 +373,21 @@ class DSPyConfidenceCalibrator:
         Returns:
             Self for method chaining
         """
-        predictions = np.array(predictions).reshape(-1, 1)
-        targets = np.array(targets)
+        # Fitting stays in float64 so fitted parameters aren't quantized
+        predictions = np.ascontiguousarray(predictions, dtype=np.float64).reshape(-1)
+        targets = np.ascontiguousarray(targets, dtype=np.int8)
         
         if self.method == "platt":
-            # Platt scaling using logistic regression
-            self.calibrator = LogisticRegression()
-            self.calibrator.fit(predictions, targets)
+            # Platt scaling: closed-form Newton fit of a 1-D sigmoid
+            self.A, self.B = _fit_platt(predictions, targets)
             
         elif self.method == "isotonic":
-            # Isotonic regression
-            self.calibrator = IsotonicRegression(out_of_bounds='clip')
-            self.calibrator.fit(predictions.flatten(), targets)
+            # Isotonic regression via pool-adjacent-violators
+            self.breakpoints, self.values = _fit_isotonic(predictions, targets)
             
         elif self.method == "temperature":
             # Temperature scaling (requires logits)
-            self.calibrator = TemperatureScaling()
+            self.calibrator = _temperature_scaling_class()()
             
         else:
             raise ValueError(f"Unknown calibration method: {self.method}")
@@ -247,26 +408,76 @@ class DSPyConfidenceCalibrator:
         if not self.is_fitted:
             raise ValueError("Calibrator not fitted. Call fit() first.")
         
-        predictions = np.array(predictions)
+        predictions = np.ascontiguousarray(predictions, dtype=np.float64)
         
         if self.method == "platt":
-            if predictions.ndim == 1:
-                predictions = predictions.reshape(-1, 1)
-            return self.calibrator.predict_proba(predictions)[:, 1]
+            return expit(-(self.A * predictions.ravel() + self.B))
             
         elif self.method == "isotonic":
-            return self.calibrator.predict(predictions)
+            # np.interp clamps to the end values outside the fitted range
+            return np.interp(predictions, self.breakpoints, self.values)
             
         elif self.method == "temperature":
-            # For temperature scaling, requires logits input
-            logits = torch.tensor(predictions, dtype=torch.float32)
-            with torch.no_grad():
-                calibrated_logits = self.calibrator(logits)
-                return torch.softmax(calibrated_logits, dim=-1).numpy()
+            # For temperature scaling, requires logits input; a scalar divide
+            # plus softmax needs no torch graph
+            return softmax(predictions / self._fitted_temperature(), axis=-1)
         
         else:
             return predictions
     
+    def _fitted_temperature(self) -> float:
+        if self.calibrator is None:
+            return self.temperature
+        return float(self.calibrator.temperature.item())
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save the fitted calibration parameters as a compressed .npz archive.
+        
+        Args:
+            path: Destination file path
+        """
+        if not self.is_fitted:
+            raise ValueError("Calibrator not fitted. Call fit() first.")
+        
+        if self.method == "platt":
+            params = {"params": np.array([self.A, self.B])}
+        elif self.method == "isotonic":
+            params = {"breakpoints": self.breakpoints, "values": self.values}
+        else:
+            params = {"params": np.array([self._fitted_temperature()])}
+        
+        # Writing through a file handle stops NumPy from appending ".npz"
+        with open(path, "wb") as f:
+            np.savez_compressed(f, method=np.array(self.method), **params)
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'DSPyConfidenceCalibrator':
+        """
+        Load a calibrator saved with save().
+        
+        Args:
+            path: Path to the .npz archive
+            
+        Returns:
+            Fitted calibrator
+        """
+        with np.load(path, allow_pickle=False) as data:
+            calibrator = cls(method=str(data["method"]))
+            
+            if calibrator.method == "platt":
+                calibrator.A, calibrator.B = (float(v) for v in data["params"])
+            elif calibrator.method == "isotonic":
+                calibrator.breakpoints = data["breakpoints"]
+                calibrator.values = data["values"]
+            elif calibrator.method == "temperature":
+                calibrator.temperature = float(data["params"][0])
+            else:
+                raise ValueError(f"Unknown calibration method: {calibrator.method}")
+        
+        calibrator.is_fitted = True
+        return calibrator
+    
     def evaluate_calibration(self, predictions: np.ndarray, targets: np.ndarray, 
                            n_bins: int = 10) -> Dict[str, float]:
         """
@@ -280,39 +491,22 @@ class DSPyConfidenceCalibrator:
         Returns:
             Dictionary with calibration metrics
         """
-        predictions = np.array(predictions)
-        targets = np.array(targets)
-        
-        # Calculate Expected Calibration Error (ECE)
-        bin_boundaries = np.linspace(0, 1, n_bins + 1)
-        bin_lowers = bin_boundaries[:-1]
-        bin_uppers = bin_boundaries[1:]
+        predictions = np.ascontiguousarray(predictions, dtype=np.float64)
+        targets = np.ascontiguousarray(targets, dtype=np.int8)
         
-        ece = 0.0
-        mce = 0.0  # Maximum Calibration Error
+        accuracies, confidences, counts = _bin_stats(predictions, targets, n_bins)
+        occupied = counts > 0
+        calibration_errors = np.abs(confidences - accuracies)
         
-        for bin_lower, bin_upper in zip(bin_lowers, bin_uppers):
-            in_bin = (predictions > bin_lower) & (predictions <= bin_upper)
-            prop_in_bin = in_bin.mean()
-            
-            if prop_in_bin > 0:
-                accuracy_in_bin = targets[in_bin].mean()
-                avg_confidence_in_bin = predictions[in_bin].mean()
-                
-                calibration_error = abs(avg_confidence_in_bin - accuracy_in_bin)
-                ece += prop_in_bin * calibration_error
-                mce = max(mce, calibration_error)
+        # Expected and Maximum Calibration Error
+        ece = float((counts * calibration_errors).sum() / len(predictions))
+        mce = float(calibration_errors[occupied].max()) if occupied.any() else 0.0
         
         # Calculate Brier Score
-        brier_score = np.mean((predictions - targets) ** 2)
+        brier_score = float(np.mean((predictions - targets) ** 2))
         
         # Calculate reliability and resolution
-        reliability = np.sum([
-            np.sum(in_bin) * (predictions[in_bin].mean() - targets[in_bin].mean()) ** 2 
-            for bin_lower, bin_upper in zip(bin_lowers, bin_uppers)
-            for in_bin in [(predictions > bin_lower) & (predictions <= bin_upper)]
-            if np.sum(in_bin) > 0
-        ]) / len(predictions)
+        reliability = float((counts * calibration_errors ** 2).sum() / len(predictions))
         
         resolution = np.var(targets)
         
@@ -349,27 +543,37 @@ class DSPyParameterOptimizer:
         Returns:
             Optimal temperature value
         """
-        predictions = validation_data["predictions"]
-        targets = validation_data["targets"]
+        # The objective stays in float64; float32 moves the optimum by more
+        # than minimize_scalar's tolerance
+        predictions = np.ascontiguousarray(validation_data["predictions"], dtype=np.float64)
+        targets = np.ascontiguousarray(validation_data["targets"], dtype=np.int8)
+        
+        # Softmax is shift-invariant; subtracting the row max once keeps every
+        # probe free of overflow, even at temperature_min
+        shifted_predictions = predictions - predictions.max(axis=-1, keepdims=True)
+        evaluator = DSPyConfidenceCalibrator()
+        
+        # Reused across probes; the NLL picks each row's true-class log-prob
+        scaled_predictions = np.empty_like(shifted_predictions)
+        rows = np.arange(len(targets))
         
         def objective_function(temperature):
             # Apply temperature scaling
-            scaled_predictions = predictions / temperature
-            scaled_probs = np.exp(scaled_predictions) / np.sum(np.exp(scaled_predictions), axis=-1, keepdims=True)
+            np.divide(shifted_predictions, temperature, out=scaled_predictions)
             
-            # Calculate objective
+            # Calculate objective (assuming binary classification)
             if objective == "ece":
-                calibrator = DSPyConfidenceCalibrator("isotonic")
-                calibrator.fit(scaled_probs[:, 1], targets)  # Assuming binary classification
-                metrics = calibrator.evaluate_calibration(scaled_probs[:, 1], targets)
+                scaled_probs = softmax(scaled_predictions, axis=-1)
+                metrics = evaluator.evaluate_calibration(scaled_probs[:, 1], targets)
                 return metrics["ece"]
                 
             elif objective == "brier":
+                scaled_probs = softmax(scaled_predictions, axis=-1)
                 return np.mean((scaled_probs[:, 1] - targets) ** 2)
                 
             elif objective == "nll":
-                return -np.mean(targets * np.log(scaled_probs[:, 1] + 1e-8) + 
-                               (1 - targets) * np.log(1 - scaled_probs[:, 1] + 1e-8))
+                log_probs = log_softmax(scaled_predictions, axis=-1)
+                return -log_probs[rows, targets].mean()
             
             else:
                 raise ValueError(f"Unknown objective: {objective}")
@@ -391,27 +595,28 @@ class DSPyParameterOptimizer:
         
         return optimal_temperature
     
-    def adaptive_learning_rate(self, loss_history: list, 
+    def adaptive_learning_rate(self, loss_history: Sequence[float], 
                               current_lr: float) -> float:
         """
         Adaptive learning rate adjustment based on loss trends.
         
         Args:
-            loss_history: List of recent loss values
+            loss_history: Recent loss values; a deque(maxlen=3) keeps it bounded
             current_lr: Current learning rate
             
         Returns:
             Adjusted learning rate
         """
-        if len(loss_history) < 3:
+        n = len(loss_history)
+        if n < 3:
             return current_lr
         
-        # Calculate trend
-        recent_losses = loss_history[-3:]
-        if recent_losses[-1] > recent_losses[-2] > recent_losses[-3]:
+        # Calculate trend from the last three losses without slicing
+        oldest, previous, latest = loss_history[n - 3], loss_history[n - 2], loss_history[n - 1]
+        if latest > previous > oldest:
             # Loss increasing - reduce learning rate
             new_lr = current_lr * 0.5
-        elif recent_losses[-1] < recent_losses[-2] < recent_losses[-3]:
+        elif latest < previous < oldest:
             # Loss decreasing - can increase learning rate slightly
             new_lr = current_lr * 1.1
         else:
@@ -441,28 +646,17 @@ class DSPyCalibrationValidator:
             n_bins: Number of bins
             save_path: Optional path to save plot
         """
-        bin_boundaries = np.linspace(0, 1, n_bins + 1)
-        bin_lowers = bin_boundaries[:-1]
-        bin_uppers = bin_boundaries[1:]
-        
-        bin_centers = []
-        bin_accuracies = []
-        bin_confidences = []
-        bin_counts = []
-        
-        for bin_lower, bin_upper in zip(bin_lowers, bin_uppers):
-            in_bin = (predictions >= bin_lower) & (predictions < bin_upper)
-            prop_in_bin = in_bin.mean()
-            
-            if prop_in_bin > 0:
-                accuracy_in_bin = targets[in_bin].mean()
-                confidence_in_bin = predictions[in_bin].mean()
-                count_in_bin = np.sum(in_bin)
-                
-                bin_centers.append((bin_lower + bin_upper) / 2)
-                bin_accuracies.append(accuracy_in_bin)
-                bin_confidences.append(confidence_in_bin)
-                bin_counts.append(count_in_bin)
+        accuracies, confidences, counts = _bin_stats(
+            np.ascontiguousarray(predictions, dtype=np.float64),
+            np.ascontiguousarray(targets, dtype=np.int8),
+            n_bins
+        )
+        occupied = counts > 0
+        bin_accuracies = accuracies[occupied]
+        bin_confidences = confidences[occupied]
+        bin_counts = counts[occupied]
+        
+        import matplotlib.pyplot as plt
         
         # Create reliability diagram
         plt.figure(figsize=(8, 6))
@@ -489,15 +683,7 @@ class DSPyCalibrationValidator:
         Returns:
             Dictionary of validation results
         """
-        bounds = DSPyParameterBounds()
-        results = {}
-        
-        for param_name in ["temperature", "max_tokens", "learning_rate", 
-                          "max_rounds", "max_examples", "reasoning_weight", "tolerance"]:
-            value = getattr(config, param_name)
-            results[param_name] = bounds.validate_parameter(param_name, value)
-        
-        return results
+        return _DEFAULT_BOUNDS.validate_all(config)
 
 
 # Example usage and testing
@@ -7,11 +7,12 @@ Clean implementation without Digital Human components
 import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, UJSONResponse
 from typing import Dict, List, Optional
 from pydantic import BaseModel
-import asyncio
-import json
+import os
 import time
+import ujson as json  # Faster JSON
 
 # Data models
 class Message(BaseModel):
@@ -33,7 +34,8 @@ class WorkflowRequest(BaseModel):
 app = FastAPI(
     title="AIQToolkit Standard API",
     description="Standard AIQToolkit API without Digital Human components",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=UJSONResponse
 )
 
 # Add CORS
@@ -74,34 +76,43 @@ AVAILABLE_WORKFLOWS = [
     }
 ]
 
+# Static responses, serialized once at startup
+_START_TS = int(time.time())
+
+_HEALTH_PAYLOAD = json.dumps({
+    "status": "healthy",
+    "service": "aiqtoolkit-standard",
+    "version": "1.0.0"
+}).encode()
+
+_MODELS_PAYLOAD = json.dumps({
+    "models": [
+        {
+            "id": model,
+            "object": "model",
+            "created": _START_TS,
+            "owned_by": "aiqtoolkit"
+        }
+        for model in AVAILABLE_MODELS
+    ]
+}).encode()
+
+_WORKFLOWS_PAYLOAD = json.dumps({"workflows": AVAILABLE_WORKFLOWS}).encode()
+
 # Health check
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "service": "aiqtoolkit-standard",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_PAYLOAD, media_type="application/json")
 
 # List models
 @app.get("/v1/models")
 async def list_models():
-    return {
-        "models": [
-            {
-                "id": model,
-                "object": "model",
-                "created": int(time.time()),
-                "owned_by": "aiqtoolkit"
-            }
-            for model in AVAILABLE_MODELS
-        ]
-    }
+    return Response(content=_MODELS_PAYLOAD, media_type="application/json")
 
 # List workflows
 @app.get("/v1/workflows")
 async def list_workflows():
-    return {"workflows": AVAILABLE_WORKFLOWS}
+    return Response(content=_WORKFLOWS_PAYLOAD, media_type="application/json")
 
 # Chat completion
 @app.post("/v1/chat/completions")
@@ -134,9 +145,8 @@ async def chat_completion(request: ChatRequest):
 # Run workflow
 @app.post("/v1/workflows/run")
 async def run_workflow(request: WorkflowRequest):
-    # Simulate workflow execution
-    await asyncio.sleep(0.1)
-    
+    # Stub execution completes immediately; real workflow steps should run
+    # blocking work via asyncio.to_thread so the event loop stays free
     return {
         "workflow_id": request.workflow_id,
         "execution_id": f"exec-{int(time.time())}",
@@ -146,25 +156,29 @@ async def run_workflow(request: WorkflowRequest):
         }
     }
 
+# Pong frame with only the timestamp filled in per message
+_PONG_TEMPLATE = '{"type":"pong","timestamp":%d}'
+
 # WebSocket for real-time communication
 @app.websocket("/v1/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
     try:
         while True:
-            data = await websocket.receive_json()
+            # Parse raw frames directly, accepting both text and binary JSON
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            data = json.loads(message.get("bytes") or message.get("text"))
             
             # Handle different message types
             if data.get("type") == "chat":
-                await websocket.send_json({
+                await websocket.send_text(json.dumps({
                     "type": "response",
                     "content": f"Echo: {data.get('content', '')}"
-                })
+                }))
             elif data.get("type") == "ping":
-                await websocket.send_json({
-                    "type": "pong",
-                    "timestamp": int(time.time())
-                })
+                await websocket.send_text(_PONG_TEMPLATE % int(time.time()))
                 
     except WebSocketDisconnect:
         print("Client disconnected")
@@ -172,4 +186,14 @@ async def websocket_endpoint(websocket: WebSocket):
 if __name__ == "__main__":
     print("Starting AIQToolkit Standard API Server")
     print("API Documentation: http://localhost:8000/docs")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # An import string is required for multiple workers; app_dir lets it
+    # resolve regardless of the directory the script is launched from.
+    # uvicorn's default "auto" loop/http pick uvloop and httptools when installed.
+    uvicorn.run(
+        "server:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        log_level="warning"
+    )
\ No newline at end of file
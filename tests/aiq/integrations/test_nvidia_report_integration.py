@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from aiq.integrations.nvidia_report_integration import NVIDIAReportGenerator
+from aiq.integrations.nvidia_report_integration import _MAX_RETRY_WAIT
+from aiq.integrations.nvidia_report_integration import _wait_retry_after
+
+
+class _ReplayHandler:
+    """MockTransport handler replaying one status code or exception per call; the last one repeats"""
+
+    def __init__(self):
+        self.responses: list[int | Exception] = []
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        outcome = self.responses[min(len(self.requests), len(self.responses)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        if outcome == 200:
+            return httpx.Response(200, json={"report": "done"})
+        return httpx.Response(outcome, headers={"Retry-After": "2"}, text="failure")
+
+
+@pytest.fixture(name="handler")
+def handler_fixture() -> _ReplayHandler:
+    return _ReplayHandler()
+
+
+@pytest.fixture(name="sleeps")
+def sleeps_fixture(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record retry backoff delays instead of sleeping"""
+    delays: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest_asyncio.fixture(name="generator")
+async def generator_fixture(handler: _ReplayHandler, sleeps: list[float]):
+    generator = NVIDIAReportGenerator(endpoint="http://report.test")
+    default_client = generator._client
+    generator._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        yield generator
+    finally:
+        await generator.aclose()
+        await default_client.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [429, 503])
+async def test_retries_transient_status(status_code: int,
+                                        generator: NVIDIAReportGenerator,
+                                        handler: _ReplayHandler,
+                                        sleeps: list[float]):
+    handler.responses = [status_code, status_code, 200]
+
+    result = await generator.run("write a report", format="markdown")
+
+    assert result == {"report": "done"}
+    assert len(handler.requests) == 3
+    assert handler.requests[0].url == "http://report.test/generate"
+    assert sleeps == [2.0, 2.0]  # Retry-After is honored
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts(generator: NVIDIAReportGenerator, handler: _ReplayHandler):
+    handler.responses = [503]
+
+    result = await generator.run("write a report")
+
+    assert result["error"] == "API Error: 503"
+    assert len(handler.requests) == 6
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [400, 401, 404, 422])
+async def test_does_not_retry_client_errors(status_code: int,
+                                            generator: NVIDIAReportGenerator,
+                                            handler: _ReplayHandler,
+                                            sleeps: list[float]):
+    handler.responses = [status_code, 200]
+
+    result = await generator.run("write a report")
+
+    assert result == {"error": f"API Error: {status_code}", "message": "failure"}
+    assert len(handler.requests) == 1
+    assert not sleeps
+
+
+@pytest.mark.asyncio
+async def test_retries_failed_connect(generator: NVIDIAReportGenerator, handler: _ReplayHandler, sleeps: list[float]):
+    handler.responses = [httpx.ConnectError("refused"), 200]
+
+    result = await generator.run("write a report")
+
+    assert result == {"report": "done"}
+    assert len(handler.requests) == 2
+    assert len(sleeps) == 1 and 0.5 <= sleeps[0] <= 1.5  # Exponential backoff with jitter
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_read_timeout(generator: NVIDIAReportGenerator, handler: _ReplayHandler):
+    handler.responses = [httpx.ReadTimeout("slow"), 200]
+
+    result = await generator.run("write a report")
+
+    assert result["message"] == "Failed to connect to NVIDIA report generator"
+    assert len(handler.requests) == 1
+
+
+@pytest.mark.parametrize("retry_after, expected", [("2", 2.0), ("3600", _MAX_RETRY_WAIT)])
+def test_retry_after_is_capped(retry_after: str, expected: float):
+    response = httpx.Response(429, headers={"Retry-After": retry_after}, request=httpx.Request("POST", "http://x"))
+    retry_state = MagicMock()
+    retry_state.outcome.exception.return_value = httpx.HTTPStatusError("rate limited",
+                                                                       request=response.request,
+                                                                       response=response)
+
+    assert _wait_retry_after(retry_state) == expected
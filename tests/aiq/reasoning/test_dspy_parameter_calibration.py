@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from aiq.reasoning.dspy_parameter_calibration import DSPyCalibrationConfig
+from aiq.reasoning.dspy_parameter_calibration import DSPyCalibrationValidator
+from aiq.reasoning.dspy_parameter_calibration import DSPyConfidenceCalibrator
+from aiq.reasoning.dspy_parameter_calibration import DSPyParameterBounds
+from aiq.reasoning.dspy_parameter_calibration import DSPyParameterOptimizer
+
+
+@pytest.fixture
+def binary_scores() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    scores = np.round(rng.random(2000), 2)  # Rounded so many scores are tied
+    targets = (rng.random(2000) < scores**2).astype(int)
+    return scores, targets
+
+
+def test_clip_parameter_uses_current_bounds():
+    bounds = DSPyParameterBounds()
+    assert bounds.clip_parameter("temperature", 9.0) == 2.0
+
+    bounds.temperature_max = 5.0
+    assert bounds.clip_parameter("temperature", 9.0) == 5.0
+    assert bounds.validate_parameter("temperature", 3.0)
+    assert bounds.clip_parameter("unknown", 9.0) == 9.0
+    assert not bounds.validate_parameter("unknown", 9.0)
+
+
+def test_config_clips_out_of_range_parameters():
+    config = DSPyCalibrationConfig(temperature=9.0, max_tokens=10)
+    assert config.temperature == 2.0
+    assert config.max_tokens == 100
+
+    with pytest.raises(ValueError):
+        DSPyCalibrationConfig(temperature=9.0, clip_invalid_parameters=False)
+
+
+@pytest.mark.parametrize("overrides",
+                         [{}, {
+                             "temperature": 3.0, "max_rounds": 0
+                         }, {
+                             "max_tokens": 100, "tolerance": 1e-2
+                         }])
+def test_validate_all_agrees_with_validate_parameter(overrides):
+    config = DSPyCalibrationConfig(validate_parameters=False, **overrides)
+    bounds = DSPyParameterBounds()
+
+    for _ in range(2):
+        expected = {name: bounds.validate_parameter(name, getattr(config, name)) for name in bounds.PARAMETER_NAMES}
+        assert bounds.validate_all(config) == expected
+
+        # Boundaries are read live, so mutating them affects both APIs
+        bounds.temperature_max = 5.0
+        bounds.max_rounds_min = 0
+
+    assert DSPyCalibrationValidator.validate_parameter_bounds(config) == DSPyParameterBounds().validate_all(config)
+
+
+def test_platt_recovers_known_parameters():
+    rng = np.random.default_rng(0)
+    scores = rng.normal(0.0, 2.0, 20000)
+    true_a, true_b = -1.5, 0.5
+    targets = (rng.random(20000) < 1.0 / (1.0 + np.exp(true_a * scores + true_b))).astype(int)
+
+    calibrator = DSPyConfidenceCalibrator("platt").fit(scores, targets)
+
+    assert calibrator.A == pytest.approx(true_a, abs=0.1)
+    assert calibrator.B == pytest.approx(true_b, abs=0.1)
+
+    probabilities = calibrator.predict_proba(scores)
+    assert probabilities.dtype == np.float64
+    assert np.all((probabilities > 0) & (probabilities < 1))
+
+
+def test_isotonic_matches_sklearn_on_tied_scores(binary_scores):
+    sklearn_isotonic = pytest.importorskip("sklearn.isotonic")
+    scores, targets = binary_scores
+
+    calibrator = DSPyConfidenceCalibrator("isotonic").fit(scores, targets)
+    reference = sklearn_isotonic.IsotonicRegression(out_of_bounds="clip").fit(scores, targets)
+
+    queries = np.linspace(-0.1, 1.1, 500)
+    np.testing.assert_allclose(calibrator.predict_proba(scores), reference.predict(scores))
+    np.testing.assert_allclose(calibrator.predict_proba(queries), reference.predict(queries))
+    assert np.all(np.diff(calibrator.values) >= 0)
+
+
+@pytest.mark.parametrize("method", ["platt", "isotonic"])
+def test_save_load_round_trip(method, binary_scores, tmp_path):
+    scores, targets = binary_scores
+    calibrator = DSPyConfidenceCalibrator(method).fit(scores, targets)
+
+    path = tmp_path / f"{method}.calib"
+    calibrator.save(path)
+    loaded = DSPyConfidenceCalibrator.load(path)
+
+    assert path.exists()
+    assert loaded.method == method
+    assert loaded.is_fitted
+    np.testing.assert_array_equal(loaded.predict_proba(scores), calibrator.predict_proba(scores))
+
+
+def test_save_load_round_trip_temperature(tmp_path):
+    torch = pytest.importorskip("torch")
+    rng = np.random.default_rng(0)
+    logits = rng.normal(0.0, 3.0, (500, 3))
+    labels = rng.integers(0, 3, 500)
+
+    calibrator = DSPyConfidenceCalibrator("temperature").fit(logits, labels)
+    calibrator.calibrator.calibrate(torch.tensor(logits), torch.tensor(labels))
+
+    path = tmp_path / "temperature.npz"
+    calibrator.save(path)
+    loaded = DSPyConfidenceCalibrator.load(path)
+
+    assert loaded.calibrator is None
+    np.testing.assert_allclose(loaded.predict_proba(logits), calibrator.predict_proba(logits), rtol=1e-6)
+
+
+def test_save_requires_fitted_calibrator(tmp_path):
+    with pytest.raises(ValueError):
+        DSPyConfidenceCalibrator("platt").save(tmp_path / "unfitted.npz")
+
+
+def _reference_bin_metrics(predictions: np.ndarray, targets: np.ndarray, n_bins: int) -> tuple[float, float, float]:
+    """Per-bin loop over (lower, upper] bins, with p == 0 counted in the first bin"""
+    bin_boundaries = np.linspace(0, 1, n_bins + 1)
+    ece = mce = reliability = 0.0
+
+    for k, (bin_lower, bin_upper) in enumerate(zip(bin_boundaries[:-1], bin_boundaries[1:])):
+        in_bin = (predictions > bin_lower) & (predictions <= bin_upper)
+        if k == 0:
+            in_bin |= predictions == bin_lower
+        if in_bin.any():
+            calibration_error = abs(predictions[in_bin].mean() - targets[in_bin].mean())
+            ece += in_bin.mean() * calibration_error
+            mce = max(mce, calibration_error)
+            reliability += in_bin.sum() * calibration_error**2
+
+    return ece, mce, reliability / len(predictions)
+
+
+@pytest.mark.parametrize(
+    "predictions",
+    [
+        np.random.default_rng(0).random(1000),
+        np.round(np.arange(0, 101) / 100, 2),  # Every value sits on an edge when n_bins=100
+        np.array([0.0, 0.3, 0.3, 0.7, 0.7, 1.0]),
+        np.array([0.05, 0.1, 0.15, 0.95]),  # Most bins empty
+    ])
+@pytest.mark.parametrize("n_bins", [5, 10, 100])
+def test_evaluate_calibration_matches_reference_loop(predictions, n_bins):
+    targets = np.random.default_rng(1).integers(0, 2, len(predictions))
+
+    metrics = DSPyConfidenceCalibrator().evaluate_calibration(predictions, targets, n_bins=n_bins)
+    ece, mce, reliability = _reference_bin_metrics(predictions, targets, n_bins)
+
+    assert metrics["ece"] == pytest.approx(ece, abs=1e-12)
+    assert metrics["mce"] == pytest.approx(mce, abs=1e-12)
+    assert metrics["reliability"] == pytest.approx(reliability, abs=1e-12)
+    assert metrics["brier_score"] == pytest.approx(np.mean((predictions - targets)**2))
+
+
+def test_evaluate_calibration_on_bin_edges():
+    # Bins: 0.0 -> first, 0.3 -> (0.2, 0.3], 0.35 -> (0.3, 0.4], 0.65 and 0.7 -> (0.6, 0.7], 1.0 -> last
+    predictions = np.array([0.0, 0.3, 0.35, 0.65, 0.7, 1.0])
+    targets = np.array([1, 0, 1, 0, 1, 1])
+
+    metrics = DSPyConfidenceCalibrator().evaluate_calibration(predictions, targets, n_bins=10)
+
+    assert metrics["ece"] == pytest.approx((1.0 + 0.3 + 0.65 + 2 * 0.175) / 6)
+    assert metrics["mce"] == pytest.approx(1.0)  # The p == 0 prediction is binned, not dropped
+    assert metrics["reliability"] == pytest.approx((1.0 + 0.3**2 + 0.65**2 + 2 * 0.175**2) / 6)
+
+
+@pytest.fixture
+def binary_logits() -> tuple[np.ndarray, np.ndarray, float]:
+    """Two-class logits whose labels are drawn at a known temperature"""
+    rng = np.random.default_rng(0)
+    temperature = 1.5
+    margins = rng.normal(0.0, 3.0, 20000)
+    targets = (rng.random(20000) < 1.0 / (1.0 + np.exp(-margins / temperature))).astype(int)
+    return np.stack([np.zeros_like(margins), margins], axis=1), targets, temperature
+
+
+@pytest.mark.parametrize("objective", ["nll", "brier", "ece"])
+def test_optimize_temperature_recovers_known_temperature(objective, binary_logits):
+    logits, targets, temperature = binary_logits
+    optimizer = DSPyParameterOptimizer()
+
+    optimal_temperature = optimizer.optimize_temperature({
+        "predictions": logits, "targets": targets
+    }, objective=objective)
+
+    assert optimizer.bounds.temperature_min < temperature < optimizer.bounds.temperature_max
+    assert optimal_temperature == pytest.approx(temperature, abs=0.1)
+    assert optimizer.optimization_history[-1]["objective"] == objective
+
+
+@pytest.mark.parametrize("objective", ["nll", "brier", "ece"])
+def test_optimize_temperature_is_finite_at_large_logit_scales(objective, binary_logits):
+    logits, targets, _ = binary_logits
+    optimizer = DSPyParameterOptimizer()
+
+    optimal_temperature = optimizer.optimize_temperature({
+        "predictions": logits * 1000.0, "targets": targets
+    }, objective=objective)
+
+    assert np.isfinite(optimal_temperature)
+    assert np.isfinite(optimizer.optimization_history[-1]["objective_value"])
+    assert optimizer.bounds.temperature_min <= optimal_temperature <= optimizer.bounds.temperature_max
+
+
+def test_optimize_temperature_rejects_unknown_objective(binary_logits):
+    logits, targets, _ = binary_logits
+    with pytest.raises(ValueError):
+        DSPyParameterOptimizer().optimize_temperature({"predictions": logits, "targets": targets}, objective="auc")
+
+
+def test_optimize_temperature_nll_gathers_true_class_for_multiclass():
+    rng = np.random.default_rng(0)
+    temperature = 1.5
+    logits = rng.normal(0.0, 3.0, (20000, 4))
+    probabilities = np.exp(logits / temperature)
+    probabilities /= probabilities.sum(axis=1, keepdims=True)
+    targets = (rng.random((20000, 1)) > probabilities.cumsum(axis=1)).sum(axis=1)
+
+    optimizer = DSPyParameterOptimizer()
+    optimal_temperature = optimizer.optimize_temperature({"predictions": logits, "targets": targets}, objective="nll")
+
+    # The gathered NLL must equal the one-hot cross-entropy at the optimum
+    scaled = logits / optimal_temperature
+    log_probs = scaled - np.log(np.exp(scaled).sum(axis=1, keepdims=True))
+    one_hot_nll = -(np.eye(4)[targets] * log_probs).sum(axis=1).mean()
+
+    assert optimal_temperature == pytest.approx(temperature, abs=0.1)
+    assert optimizer.optimization_history[-1]["objective_value"] == pytest.approx(one_hot_nll)